@@ -1,24 +1,77 @@
 import os
+import re
+import asyncio
+import hashlib
 import logging
+import sqlite3
+import threading
 import uuid
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 from typing import Optional
-from dotenv import load_dotenv
-from agents import Agent, Runner, SQLiteSession
+from agents import Agent, AgentOutputSchema, Runner, SQLiteSession
+from backend.cache import TTLCache
+from backend.config import settings
 from backend.utils import SearchRequestParams, Facets, QueryParameters
 
-# Load environment variables
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 # Create router for advanced_ai search API
 router = APIRouter(prefix="/api/advanced_ai", tags=["advanced_ai"])
 
-# In-memory session store: maps session_id to SQLiteSession instances
-# Using in-memory SQLite sessions (no db_path specified)
-_sessions: dict[str, SQLiteSession] = {}
+# Chat sessions idle for longer than this are dropped from the session store
+SESSION_TTL_SECONDS = 3600
+
+# Session store: maps session_id to SQLiteSession handles for active conversations.
+# Conversation history for every session lives in one on-disk SQLite database
+# (settings.sessions_db), so cold conversations sit in the OS page cache instead of the Python heap.
+# Bounded so idle handles are dropped instead of accumulating forever. Eviction only
+# drops the handle: SQLiteSession keeps a connection per worker thread, which is
+# released when the handle is garbage collected, and the history stays in the
+# database, so it is reopened from disk if the user returns.
+_sessions: TTLCache[SQLiteSession] = TTLCache(maxsize=10_000, ttl=SESSION_TTL_SECONDS)
+
+
+def _prune_sessions_sync(db_path: str, max_age_seconds: int) -> int:
+    """Delete sessions (and their messages) last updated more than max_age_seconds ago."""
+    if not os.path.exists(db_path):
+        return 0
+    
+    # SQLiteSession stores timestamps as UTC CURRENT_TIMESTAMP, the same format datetime('now') returns
+    cutoff = f"-{int(max_age_seconds)} seconds"
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(
+            "DELETE FROM agent_messages WHERE session_id IN "
+            "(SELECT session_id FROM agent_sessions WHERE updated_at < datetime('now', ?))",
+            (cutoff,),
+        )
+        deleted = conn.execute(
+            "DELETE FROM agent_sessions WHERE updated_at < datetime('now', ?)",
+            (cutoff,),
+        ).rowcount
+        conn.commit()
+        return deleted
+    finally:
+        conn.close()
+
+
+async def prune_sessions(max_age_seconds: int = SESSION_TTL_SECONDS) -> None:
+    """Remove expired chat history from the session database so it does not grow without bound."""
+    try:
+        deleted = await asyncio.to_thread(_prune_sessions_sync, settings.sessions_db, max_age_seconds)
+    except sqlite3.Error as e:
+        logger.warning(f"Error pruning chat sessions in {settings.sessions_db}: {e}")
+        return
+    if deleted:
+        logger.info(f"Pruned {deleted} expired chat sessions from {settings.sessions_db}")
+
+
+async def prune_sessions_periodically() -> None:
+    """Prune expired chat sessions at startup and then once every session TTL."""
+    while True:
+        await prune_sessions()
+        await asyncio.sleep(SESSION_TTL_SECONDS)
 
 # Agent prompt for chat endpoint
 CHAT_AGENT_PROMPT = """You are a helpful real estate search assistant. Your job is to understand user messages and determine if they are asking for a property search or just having a conversation.
@@ -70,6 +123,10 @@ User: "I'm looking for a house."
 """
 
 
+# Bump when CHAT_AGENT_PROMPT or ChatAgentOutput changes so cached replies are not reused
+CHAT_PROMPT_VERSION = "1"
+
+
 class ChatAgentOutput(BaseModel):
     """Output from the chat agent."""
     message: str = Field(description="Assistant's response message explaining what it's doing")
@@ -79,10 +136,13 @@ class ChatAgentOutput(BaseModel):
     )
 
 
+# The Runner otherwise rebuilds the type adapter and strict JSON schema on every run
+_CHAT_OUTPUT_SCHEMA = AgentOutputSchema(ChatAgentOutput)
+
+
 def _create_chat_agent() -> Optional[Agent]:
     """Create and configure the OpenAI agent for chat."""
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
+    if not settings.openai_api_key:
         logger.warning("OPENAI_API_KEY not set, chat agent will not be available")
         return None
     
@@ -90,7 +150,7 @@ def _create_chat_agent() -> Optional[Agent]:
         agent = Agent(
             name="Chat Assistant",
             instructions=CHAT_AGENT_PROMPT,
-            output_type=ChatAgentOutput,
+            output_type=_CHAT_OUTPUT_SCHEMA,
             model="gpt-4.1"
         )
         return agent
@@ -99,6 +159,84 @@ def _create_chat_agent() -> Optional[Agent]:
         return None
 
 
+# The chat agent is immutable between requests, so it is built once and shared
+_chat_agent: Optional[Agent] = None
+_chat_agent_lock = threading.Lock()
+
+
+def _get_chat_agent() -> Optional[Agent]:
+    """Return the shared chat agent, creating it on first use."""
+    global _chat_agent
+    if _chat_agent is None:
+        with _chat_agent_lock:
+            if _chat_agent is None:
+                _chat_agent = _create_chat_agent()
+    return _chat_agent
+
+
+# Agent outputs for the opening message of a conversation, keyed by a hash of the full agent input.
+# Only opening messages are cached because later turns also depend on the session history.
+_chat_output_cache: TTLCache[ChatAgentOutput] = TTLCache(maxsize=1024, ttl=300)
+
+
+def _chat_cache_key(user_message_with_context: str) -> bytes:
+    """Build the content-addressed cache key for an agent input."""
+    return hashlib.sha256(
+        b"\x00".join([CHAT_PROMPT_VERSION.encode(), user_message_with_context.encode()])
+    ).digest()
+
+
+# Opening messages that never need the agent: greetings, thanks and sign-offs.
+# Only the first message of a new session is checked, since later in a conversation
+# a reply like "ok" may be confirming something the agent offered to do.
+_TRIVIAL_MESSAGE = re.compile(r"^(hi|hello|hey|thanks|thank you|ok|okay|bye|goodbye)[!.?\s]*$", re.IGNORECASE)
+
+# Canned replies for trivial messages, keyed by the matched phrase
+_TRIVIAL_REPLIES = {
+    "hi": "Hello! I'm here to help you find your perfect property. What are you looking for?",
+    "hello": "Hello! I'm here to help you find your perfect property. What are you looking for?",
+    "hey": "Hello! I'm here to help you find your perfect property. What are you looking for?",
+    "thanks": "You're welcome! Let me know if you'd like to refine your search or look for something else.",
+    "thank you": "You're welcome! Let me know if you'd like to refine your search or look for something else.",
+    "ok": "Great! Tell me what you'd like to search for next.",
+    "okay": "Great! Tell me what you'd like to search for next.",
+    "bye": "Goodbye! Come back anytime you want to search for more properties.",
+    "goodbye": "Goodbye! Come back anytime you want to search for more properties.",
+}
+
+
+# Descriptions longer than this are truncated in the agent context
+_DESC_LIMIT = 200
+_ELLIPSIS = "..."
+
+# Context lines describing one search result for the chat agent
+_SEARCH_RESULT_TEMPLATE = (
+    "  {i}. {title}\n"
+    "     Type: {property_type}, Bedrooms: {bedrooms}, Price: ${price:,}\n"
+    "     Square feet: {square_feet}, Location: {city}, {neighborhood}"
+)
+
+
+def _format_search_result(i: int, prop: dict) -> str:
+    """Format a search result property as agent context."""
+    text = _SEARCH_RESULT_TEMPLATE.format(
+        i=i,
+        title=prop.get('title', 'N/A'),
+        property_type=prop.get('property_type', 'N/A'),
+        bedrooms=prop.get('bedrooms', 'N/A'),
+        price=prop.get('price', 0),
+        square_feet=prop.get('square_feet', 'N/A'),
+        city=prop.get('city', 'N/A'),
+        neighborhood=prop.get('neighborhood', 'N/A'),
+    )
+    desc = prop.get('description')
+    if desc:
+        # Truncate description if too long
+        desc = desc[:_DESC_LIMIT] + (_ELLIPSIS if len(desc) > _DESC_LIMIT else "")
+        text += f"\n     Description: {desc}"
+    return text
+
+
 class ChatRequest(BaseModel):
     """Chat request with optional search context."""
     message: str = Field(description="User's chat message")
@@ -133,22 +271,26 @@ class ChatResponse(BaseModel):
         description="Optional search parameters to update the search"
     )
 
-@router.post("/chat")
+@router.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """Chat endpoint that receives user messages with optional search context."""
-    logger.info("=" * 60)
-    logger.info("POST /api/advanced_ai/chat - Chat request received")
-    logger.info(f"  Message: {request.message}")
-    logger.info(f"  Session ID: {request.session_id}")
-    
-    if request.search_params:
-        logger.info(f"  Search params: {request.search_params}")
-    if request.search_results:
-        logger.info(f"  Search results: {len(request.search_results)} properties")
-    if request.total is not None:
-        logger.info(f"  Total results: {request.total}")
-    if request.facets:
-        logger.info(f"  Facets: {request.facets}")
+    # Emit the request header as one record to take the logging lock once
+    if logger.isEnabledFor(logging.INFO):
+        lines = [
+            "=" * 60,
+            "POST /api/advanced_ai/chat - Chat request received",
+            f"  Message: {request.message}",
+            f"  Session ID: {request.session_id}",
+        ]
+        if request.search_params:
+            lines.append(f"  Search params: {request.search_params}")
+        if request.search_results:
+            lines.append(f"  Search results: {len(request.search_results)} properties")
+        if request.total is not None:
+            lines.append(f"  Total results: {request.total}")
+        if request.facets:
+            lines.append(f"  Facets: {request.facets}")
+        logger.info("\n".join(lines))
     
     # If no message and no search params, don't respond
     if (not request.message or request.message.strip() == ""):
@@ -165,18 +307,18 @@ async def chat(request: ChatRequest):
     if session_id is None:
         # Create new session with unique ID
         session_id = str(uuid.uuid4())
-        session = SQLiteSession(session_id)  # In-memory session
-        _sessions[session_id] = session
+        session = SQLiteSession(session_id, db_path=settings.sessions_db)
         logger.info(f"  Created new session: {session_id}")
     else:
-        # Retrieve existing session or create if not found
-        if session_id not in _sessions:
-            logger.warning(f"  Session {session_id} not found, creating new session")
-            session = SQLiteSession(session_id)
-            _sessions[session_id] = session
+        # Retrieve the open session, or reopen it from disk if it was evicted or is unknown
+        session = _sessions.get(session_id)
+        if session is None:
+            logger.info(f"  Session {session_id} not open, opening from session database")
+            session = SQLiteSession(session_id, db_path=settings.sessions_db)
         else:
-            session = _sessions[session_id]
             logger.info(f"  Using existing session: {session_id}")
+    # Store on every message so the idle timeout restarts
+    _sessions.set(session_id, session)
     
     # Check if this is a search update (empty message with search context)
     if (not request.message or request.message.strip() == "") and \
@@ -187,9 +329,27 @@ async def chat(request: ChatRequest):
 
         return ChatResponse(session_id=session_id)
     
+    # Answer a trivial opening message without calling the agent
+    trivial_match = request.session_id is None and _TRIVIAL_MESSAGE.match(request.message.strip())
+    if trivial_match:
+        response_message = _TRIVIAL_REPLIES[trivial_match.group(1).lower()]
+        logger.info("  Trivial message - bypassing chat agent")
+        # Record the exchange so follow-up messages in this session keep their context;
+        # the canned reply is still returned if the session database cannot be written
+        try:
+            await session.add_items([
+                {"role": "user", "content": request.message},
+                {"role": "assistant", "content": response_message},
+            ])
+        except Exception as e:
+            logger.error(f"Error saving trivial message to session {session_id}: {e}", exc_info=True)
+        logger.info(f"  Response: {response_message}")
+        logger.info("=" * 60)
+        return ChatResponse(message=response_message, session_id=session_id)
+    
     # Use AI agent to process the message
     try:
-        agent = _create_chat_agent()
+        agent = _get_chat_agent()
         if agent is None:
             # Fallback if agent is not available
             logger.warning("Chat agent not available, using fallback response")
@@ -202,7 +362,8 @@ async def chat(request: ChatRequest):
         context_parts = [f'User message: "{request.message}"']
         
         if request.search_params:
-            context_parts.append(f"\nCurrent search parameters: {request.search_params.model_dump_json(indent=2)}")
+            # Compact JSON keeps the prompt short; whitespace only costs tokens
+            context_parts.append(f"\nCurrent search parameters: {request.search_params.model_dump_json()}")
         
         if request.facets:
             context_parts.append(f"\nAvailable filter options (facets):")
@@ -223,33 +384,40 @@ async def chat(request: ChatRequest):
             
             # Include actual search results so agent has visibility
             context_parts.append("\nSearch results details:")
-            for i, prop in enumerate(request.search_results[:10], 1):  # Limit to first 10 for context
-                prop_info = [
-                    f"  {i}. {prop.get('title', 'N/A')}",
-                    f"     Type: {prop.get('property_type', 'N/A')}, Bedrooms: {prop.get('bedrooms', 'N/A')}, Price: ${prop.get('price', 0):,}",
-                    f"     Square feet: {prop.get('square_feet', 'N/A')}, Location: {prop.get('city', 'N/A')}, {prop.get('neighborhood', 'N/A')}",
-                ]
-                if prop.get('description'):
-                    # Truncate description if too long
-                    desc = prop['description']
-                    if len(desc) > 200:
-                        desc = desc[:200] + "..."
-                    prop_info.append(f"     Description: {desc}")
-                context_parts.append("\n".join(prop_info))
+            context_parts.append("\n".join(
+                _format_search_result(i, prop)
+                for i, prop in enumerate(request.search_results[:10], 1)  # Limit to first 10 for context
+            ))
         
         user_message_with_context = "\n".join(context_parts)
         
-        logger.info("Calling OpenAI Agents SDK for chat...")
-        logger.debug(f"Context: {user_message_with_context}")
+        cache_key = None
+        agent_output = None
+        if request.session_id is None:
+            cache_key = _chat_cache_key(user_message_with_context)
+            agent_output = _chat_output_cache.get(cache_key)
         
-        # Run the agent with session for conversation memory
-        result = await Runner.run(agent, user_message_with_context, session=session)
-        agent_output = result.final_output
+        if agent_output is not None:
+            logger.info("Using cached chat agent response")
+            # Record the exchange so follow-up messages in this session keep their context
+            await session.add_items([
+                {"role": "user", "content": user_message_with_context},
+                {"role": "assistant", "content": agent_output.model_dump_json()},
+            ])
+        else:
+            logger.info("Calling OpenAI Agents SDK for chat...")
+            logger.debug(f"Context: {user_message_with_context}")
+            
+            # Run the agent with session for conversation memory
+            result = await Runner.run(agent, user_message_with_context, session=session)
+            agent_output = result.final_output
+            if cache_key is not None:
+                _chat_output_cache.set(cache_key, agent_output)
         
         logger.info("Chat agent response received")
         logger.info(f"  Message: {agent_output.message}")
-        if agent_output.query_params:
-            logger.info(f"  Query params: {agent_output.query_params.model_dump_json(indent=2)}")
+        if agent_output.query_params and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"  Query params: {agent_output.query_params.model_dump_json(indent=2)}")
         
         # Convert QueryParameters to SearchRequestParams if present
         search_params = None
@@ -257,7 +425,8 @@ async def chat(request: ChatRequest):
             search_params = agent_output.query_params.to_search_request_params(
                 merge_with=request.search_params
             )
-            logger.info(f"  Converted search params: {search_params.model_dump_json(indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"  Converted search params: {search_params.model_dump_json(indent=2)}")
         
         logger.info("=" * 60)
         return ChatResponse(
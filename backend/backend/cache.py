@@ -0,0 +1,89 @@
+"""
+Small in-process caches for reusing expensive results across requests.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Once `maxsize` entries are stored, the least recently used entry is evicted.
+    If `ttl` is None, entries never expire and only LRU eviction applies.
+    `on_evict` is called with every value that leaves the cache: on expiry, LRU
+    eviction, replacement by a different value, pop and clear.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[V], None]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._data: "OrderedDict[Hashable, tuple[float, V]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._evict(key)
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store value under key, evicting the least recently used entries if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            old = self._data.get(key)
+            if old is not None:
+                self._data.move_to_end(key)
+            self._data[key] = (expires_at, value)
+            if old is not None and old[1] is not value and self.on_evict is not None:
+                self.on_evict(old[1])
+            while len(self._data) > self.maxsize:
+                self._evict(next(iter(self._data)))
+
+    def pop(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Remove key and return its value, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            self._evict(key)
+            return default if entry[0] < time.monotonic() else entry[1]
+
+    def clear(self) -> None:
+        """Evict every entry."""
+        with self._lock:
+            for key in list(self._data):
+                self._evict(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        """Return the number of live entries, evicting any that have expired."""
+        with self._lock:
+            now = time.monotonic()
+            for key in [key for key, (expires_at, _) in self._data.items() if expires_at < now]:
+                self._evict(key)
+            return len(self._data)
+
+    def _evict(self, key: Hashable) -> None:
+        _, value = self._data.pop(key)
+        if self.on_evict is not None:
+            self.on_evict(value)
@@ -0,0 +1,37 @@
+"""
+Application settings, read once from the environment at startup.
+"""
+
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from dotenv import load_dotenv
+
+# Load environment variables; the OpenAI Agents SDK also reads OPENAI_API_KEY from os.environ
+load_dotenv()
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Environment settings; they do not change while the server is running."""
+    openai_api_key: Optional[str]
+    convertkit_api_key: Optional[str]
+    convertkit_api_secret: Optional[str]
+    allowed_origins: Tuple[str, ...]
+    sessions_db: str
+
+
+settings = Settings(
+    openai_api_key=os.getenv("OPENAI_API_KEY"),
+    convertkit_api_key=os.getenv("CONVERTKIT_API_KEY"),
+    convertkit_api_secret=os.getenv("CONVERTKIT_API_SECRET"),
+    # Get allowed origins from environment or default to localhost
+    allowed_origins=tuple(os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")),
+    # Chat history database, on disk so idle conversations do not stay in process memory.
+    # The default lives in the system temp directory, which may be cleared on reboot;
+    # set SESSIONS_DB to a persistent path if history must survive that. Sessions idle
+    # longer than the chat session TTL are deleted at startup and then periodically
+    # (see advanced.router.prune_sessions).
+    sessions_db=os.getenv("SESSIONS_DB", os.path.join(tempfile.gettempdir(), "agent_sessions.db")),
+)
@@ -2,18 +2,16 @@
 OpenAI agent for interpreting user queries into structured search parameters.
 """
 
-import os
 import logging
+import threading
 import time
 from typing import Optional
-from dotenv import load_dotenv
-from agents import Agent, ModelSettings, Runner
+from agents import Agent, AgentOutputSchema, ModelSettings, Runner
 from openai.types.shared import Reasoning
+from backend.cache import TTLCache
+from backend.config import settings
 from backend.utils import QueryParameters
 
-# Load environment variables
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 
@@ -126,10 +124,13 @@ You will receive the user's search text. Your job is to extract structured param
 3. **Follow the output schema** - the schema defines valid values and structure"""
 
 
+# The Runner otherwise rebuilds the type adapter and strict JSON schema on every run
+_OUTPUT_SCHEMA = AgentOutputSchema(QueryParameters)
+
+
 def _create_agent() -> Optional[Agent]:
     """Create and configure the OpenAI agent."""
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
+    if not settings.openai_api_key:
         return None
     
     try:
@@ -137,7 +138,7 @@ def _create_agent() -> Optional[Agent]:
         agent = Agent(
             name="Query Interpreter",
             instructions=AGENT_PROMPT,
-            output_type=QueryParameters,
+            output_type=_OUTPUT_SCHEMA,
             # unfortuntely there is not setting for "no reasoning" in the OpenAI Agents SDK, so we are using gpt-4.1 instead
             # this setting exists on the 5.1 models if we are using the model API, but I don't want to add all the boilerplate code for that here
             model="gpt-4.1" # "gpt-5-nano-2025-08-07", # "gpt-5.1-2025-11-13", "gpt-5-mini-2025-08-07", 
@@ -150,6 +151,31 @@ def _create_agent() -> Optional[Agent]:
         return None
 
 
+# The agent is immutable between requests, so it is built once and shared
+_agent: Optional[Agent] = None
+_agent_lock = threading.Lock()
+
+
+def _get_agent() -> Optional[Agent]:
+    """Return the shared query interpreter agent, creating it on first use."""
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                _agent = _create_agent()
+    return _agent
+
+
+# Interpretations keyed by normalized query text; the same searches recur across users.
+# Entries expire after a day so prompt or model changes are eventually picked up.
+_interpretation_cache: TTLCache[QueryParameters] = TTLCache(maxsize=2048, ttl=24 * 3600)
+
+
+def _normalize_query(q: str) -> str:
+    """Normalize a query for cache lookups: lowercase with collapsed whitespace."""
+    return " ".join(q.lower().split())
+
+
 async def interpret_user_query(q: Optional[str] = None) -> Optional[QueryParameters]:
     """
     Interpret user query using OpenAI Agents SDK.
@@ -167,12 +193,18 @@ async def interpret_user_query(q: Optional[str] = None) -> Optional[QueryParamet
         logger.warning("No query provided. Skipping interpretation.")
         return None
         
-    if not os.getenv("OPENAI_API_KEY"):
+    if not settings.openai_api_key:
         raise ValueError("OPENAI_API_KEY is not set")
     
+    cache_key = _normalize_query(q)
+    cached_params = _interpretation_cache.get(cache_key)
+    if cached_params is not None:
+        logger.info("Using cached interpretation for user query")
+        # Hand out a copy so callers cannot alter the cached entry
+        return cached_params.model_copy(deep=True)
+    
     try:
-        # Create the agent
-        agent = _create_agent()
+        agent = _get_agent()
         if agent is None:
             return None
         
@@ -191,6 +223,7 @@ async def interpret_user_query(q: Optional[str] = None) -> Optional[QueryParamet
         logger.info("OpenAI Agents SDK interpretation completed successfully")
         logger.info(f"Interpreted parameters: {interpreted_params.model_dump_json(indent=2)}")
         
+        _interpretation_cache.set(cache_key, interpreted_params.model_copy(deep=True))
         return interpreted_params
         
     except Exception as e:
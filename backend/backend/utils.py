@@ -3,8 +3,39 @@ Utility functions and models for the backend.
 """
 
 import copy
-from typing import List, Optional, Dict, Any
+import heapq
+import logging
+from operator import itemgetter
+from bisect import bisect_right
+from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field, field_validator, model_validator
+from backend.cache import TTLCache
+from backend.mock_data import MOCK_PROPERTIES
+
+logger = logging.getLogger(__name__)
+
+
+# Allowed values for the enumerated QueryParameters fields
+_VALID_PROPERTY_TYPES = frozenset({'house', 'condo', 'apartment', 'townhouse'})
+_VALID_BEDROOMS = frozenset({'0', '1', '2', '3', '4', '5'})
+_VALID_SORTS = frozenset({'relevance', 'price_asc', 'price_desc', 'newest'})
+
+# (minimum, maximum) field pairs that must be ordered when both are provided
+_RANGE_FIELDS = (('min_price', 'max_price'), ('min_sqft', 'max_sqft'))
+
+
+# QueryParameters fields in URL parameter order, with an optional encoder for list values
+_URL_PARAM_FIELDS = (
+    ('title', None),
+    ('description', None),
+    ('property_type', ','.join),
+    ('bedrooms', ','.join),
+    ('min_price', None),
+    ('max_price', None),
+    ('min_sqft', None),
+    ('max_sqft', None),
+    ('sort', None),
+)
 
 
 class QueryParameters(BaseModel):
@@ -68,25 +99,19 @@ class QueryParameters(BaseModel):
     @classmethod
     def validate_property_type(cls, v):
         """Validate property_type values."""
-        if v is None:
+        if v is None or _VALID_PROPERTY_TYPES.issuperset(v):
             return v
-        valid_types = {'house', 'condo', 'apartment', 'townhouse'}
-        invalid = [pt for pt in v if pt not in valid_types]
-        if invalid:
-            raise ValueError(f"Invalid property_type values: {invalid}. Must be one of {valid_types}")
-        return v
+        invalid = [pt for pt in v if pt not in _VALID_PROPERTY_TYPES]
+        raise ValueError(f"Invalid property_type values: {invalid}. Must be one of {sorted(_VALID_PROPERTY_TYPES)}")
     
     @field_validator('bedrooms')
     @classmethod
     def validate_bedrooms(cls, v):
         """Validate bedroom values."""
-        if v is None:
+        if v is None or _VALID_BEDROOMS.issuperset(v):
             return v
-        valid_bedrooms = {'0', '1', '2', '3', '4', '5'}
-        invalid = [b for b in v if b not in valid_bedrooms]
-        if invalid:
-            raise ValueError(f"Invalid bedroom values: {invalid}. Must be one of {valid_bedrooms}")
-        return v
+        invalid = [b for b in v if b not in _VALID_BEDROOMS]
+        raise ValueError(f"Invalid bedroom values: {invalid}. Must be one of {sorted(_VALID_BEDROOMS)}")
     
     @field_validator('sort')
     @classmethod
@@ -95,49 +120,39 @@ class QueryParameters(BaseModel):
         # Convert None to default value "relevance" since LLM may explicitly return null
         if v is None:
             return "relevance"
-        valid_sorts = {'relevance', 'price_asc', 'price_desc', 'newest'}
-        if v not in valid_sorts:
-            raise ValueError(f"Invalid sort value: {v}. Must be one of {valid_sorts}")
+        if v not in _VALID_SORTS:
+            raise ValueError(f"Invalid sort value: {v}. Must be one of {sorted(_VALID_SORTS)}")
         return v
     
     @model_validator(mode='after')
     def validate_ranges(self):
         """Validate that min_price <= max_price and min_sqft <= max_sqft if both are provided."""
-        if self.min_price is not None and self.max_price is not None:
-            if self.min_price > self.max_price:
-                raise ValueError(f"min_price ({self.min_price}) cannot be greater than max_price ({self.max_price})")
-        
-        if self.min_sqft is not None and self.max_sqft is not None:
-            if self.min_sqft > self.max_sqft:
-                raise ValueError(f"min_sqft ({self.min_sqft}) cannot be greater than max_sqft ({self.max_sqft})")
+        for min_field, max_field in _RANGE_FIELDS:
+            minimum = getattr(self, min_field)
+            maximum = getattr(self, max_field)
+            if minimum is not None and maximum is not None and minimum > maximum:
+                raise ValueError(f"{min_field} ({minimum}) cannot be greater than {max_field} ({maximum})")
         
         return self
     
-    def to_url_params(self) -> dict:
+    def to_url_params(self) -> Dict[str, Any]:
         """Convert to URL parameter format (for FastAPI Query parameters)."""
-        params = {}
+        params: Dict[str, Any] = {}
+        values = self.__dict__
         
-        if self.title:
-            params['title'] = self.title
-        if self.description:
-            params['description'] = self.description
-        if self.property_type:
-            params['property_type'] = ','.join(self.property_type)
-        if self.bedrooms:
-            params['bedrooms'] = ','.join(self.bedrooms)
-        if self.min_price is not None:
-            params['min_price'] = self.min_price
-        if self.max_price is not None:
-            params['max_price'] = self.max_price
-        if self.min_sqft is not None:
-            params['min_sqft'] = self.min_sqft
-        if self.max_sqft is not None:
-            params['max_sqft'] = self.max_sqft
-        if self.sort:
-            params['sort'] = self.sort
+        for name, encode in _URL_PARAM_FIELDS:
+            value = values[name]
+            # Skip unset fields; empty strings and lists are treated as unset too
+            if value is None or value == '' or value == []:
+                continue
+            params[name] = encode(value) if encode else value
         
         return params
     
+    def to_dict_non_none(self) -> Dict[str, Any]:
+        """Return the fields that are set, like model_dump(exclude_none=True) without the serializer."""
+        return {k: v for k, v in self.__dict__.items() if v is not None}
+    
     def to_search_request_params(
         self, 
         q: Optional[str] = None,
@@ -361,122 +376,92 @@ class SearchContext(BaseModel):
     )
 
 
+def _build_word_index(properties: List[Dict[str, Any]], field: str) -> Dict[str, List[int]]:
+    """Map each lowercased word of a text field to the positions of the properties containing it."""
+    index: Dict[str, List[int]] = {}
+    for i, prop in enumerate(properties):
+        for word in {word.lower() for word in prop[field].split()}:
+            index.setdefault(word, []).append(i)
+    return index
+
+
+# Word indexes over the static mock data, so scoring only visits properties that match
+_WORD_INDEXES = {
+    "title": _build_word_index(MOCK_PROPERTIES, "title"),
+    "description": _build_word_index(MOCK_PROPERTIES, "description"),
+}
+
+
+def _add_word_matches(
+    scores: Dict[str, int],
+    properties: List[Dict[str, Any]],
+    field: str,
+    query: str,
+) -> None:
+    """Add one point to a property's score per query word found in its field."""
+    query_words = [word.lower() for word in query.split() if word.strip()]
+    
+    if properties is MOCK_PROPERTIES:
+        # Look up matching properties in the precomputed index
+        index = _WORD_INDEXES[field]
+        for word in query_words:
+            for i in index.get(word, ()):
+                prop_id = properties[i]["id"]
+                scores[prop_id] = scores.get(prop_id, 0) + 1
+        return
+    
+    for prop in properties:
+        prop_words = {word.lower() for word in prop[field].split()}
+        # Count how many query words match property words
+        matches = sum(1 for word in query_words if word in prop_words)
+        if matches:
+            scores[prop["id"]] = scores.get(prop["id"], 0) + matches
+
+
 def score_title_and_description(
     properties: List[Dict[str, Any]],
     title: Optional[str] = None,
     description: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+) -> Dict[str, int]:
     """Score properties based on title and description matches.
     
-    Returns a deep copy of properties with score fields added.
-    Score is 0 if no matches, or sum of matching words from title and description.
+    Returns a mapping of property id to score, the sum of matching words from title
+    and description. Properties without matches are left out (their score is 0),
+    and the properties themselves are not modified.
     """
-    scored = copy.deepcopy(properties)
-    
-    # Initialize scores to 0
-    for prop in scored:
-        prop["score"] = 0
+    scores: Dict[str, int] = {}
     
     # Calculate relevance scores based on title matches
     if title:
-        title_words = [word.lower() for word in title.split() if word.strip()]
-        for prop in scored:
-            prop_title_words = [word.lower() for word in prop["title"].split() if word.strip()]
-            # Count how many title words match property title words
-            matching_words = sum(1 for word in title_words if word in prop_title_words)
-            prop["score"] += matching_words
+        _add_word_matches(scores, properties, "title", title)
     
     # Calculate relevance scores based on description matches
     if description:
-        desc_words = [word.lower() for word in description.split() if word.strip()]
-        for prop in scored:
-            prop_desc_words = [word.lower() for word in prop["description"].split() if word.strip()]
-            # Count how many description words match property description words
-            matching_words = sum(1 for word in desc_words if word in prop_desc_words)
-            prop["score"] += matching_words
+        _add_word_matches(scores, properties, "description", description)
     
-    return scored
+    return scores
 
 
-def filter_properties(
-    properties: List[Dict[str, Any]],
-    title: Optional[str] = None,
-    description: Optional[str] = None,
-    property_type: Optional[List[str]] = None,
-    bedrooms: Optional[List[str]] = None,
-    min_price: Optional[int] = None,
-    max_price: Optional[int] = None,
-    min_sqft: Optional[int] = None,
-    max_sqft: Optional[int] = None,
-) -> List[Dict[str, Any]]:
-    """Filter properties based on query parameters.
-    
-    Properties should already be scored via score_title_and_description().
-    This function filters based on score (if title/description provided) and other filters.
-    """
-    filtered = copy.deepcopy(properties)
-    initial_count = len(filtered)
-    
-    # Filter out properties with score of 0 (no relevance matches)
-    # Only apply this filter if there is a text query (title or description)
-    # If neither is present, all properties will have score 0, so we shouldn't filter them out
-    if title or description:
-        before_score = len(filtered)
-        filtered = [p for p in filtered if p.get("score", 0) > 0]
-        # If score filtering removed all items, fall back to showing all properties
-        if len(filtered) == 0:
-            filtered = copy.deepcopy(properties)
-    
-    # Property type filter
-    if property_type:
-        before = len(filtered)
-        filtered = [p for p in filtered if p["property_type"] in property_type]
-    
-    # Bedrooms filter
-    if bedrooms:
-        bedroom_nums = [int(b) for b in bedrooms if b.isdigit()]
-        before = len(filtered)
-        filtered = [p for p in filtered if p["bedrooms"] in bedroom_nums]
-    
-    # Price filters
-    if min_price is not None:
-        before = len(filtered)
-        filtered = [p for p in filtered if p["price"] >= min_price]
-    if max_price is not None:
-        before = len(filtered)
-        filtered = [p for p in filtered if p["price"] <= max_price]
-    
-    # Square feet filters
-    if min_sqft is not None:
-        before = len(filtered)
-        filtered = [p for p in filtered if p["square_feet"] >= min_sqft]
-    if max_sqft is not None:
-        before = len(filtered)
-        filtered = [p for p in filtered if p["square_feet"] <= max_sqft]
-    
-    return filtered
+# Facet bucket upper bounds (exclusive) and labels; a value's bucket is found with bisect
+_PRICE_EDGES = (500000, 750000, 1000000, 1500000)
+_PRICE_LABELS = ("0-500000", "500000-750000", "750000-1000000", "1000000-1500000", "1500000-999999999")
+_SQFT_EDGES = (800, 1200, 1800, 2500)
+_SQFT_LABELS = ("0-800", "800-1200", "1200-1800", "1800-2500", "2500-999999")
 
 
-def calculate_facets(properties: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Calculate facet counts from properties."""
-    facets = {
+def _empty_facets() -> Dict[str, Any]:
+    """Return facet counters with every fixed range bucket set to zero."""
+    return {
         "property_type": {},
         "bedrooms": {},
-        "price_ranges": {
-            "0-500000": 0,
-            "500000-750000": 0,
-            "750000-1000000": 0,
-            "1000000-1500000": 0,
-            "1500000-999999999": 0,
-        },
-        "square_feet_ranges": {
-            "0-800": 0,
-            "800-1200": 0,
-            "1200-1800": 0,
-            "1800-2500": 0,
-            "2500-999999": 0,
-        },
+        "price_ranges": dict.fromkeys(_PRICE_LABELS, 0),
+        "square_feet_ranges": dict.fromkeys(_SQFT_LABELS, 0),
     }
+
+
+def calculate_facets(properties: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Calculate facet counts from properties."""
+    facets = _empty_facets()
     
     for prop in properties:
         # Property type
@@ -488,40 +473,17 @@ def calculate_facets(properties: List[Dict[str, Any]]) -> Dict[str, Any]:
         facets["bedrooms"][br] = facets["bedrooms"].get(br, 0) + 1
         
         # Price ranges
-        price = prop["price"]
-        if price < 500000:
-            facets["price_ranges"]["0-500000"] += 1
-        elif price < 750000:
-            facets["price_ranges"]["500000-750000"] += 1
-        elif price < 1000000:
-            facets["price_ranges"]["750000-1000000"] += 1
-        elif price < 1500000:
-            facets["price_ranges"]["1000000-1500000"] += 1
-        else:
-            facets["price_ranges"]["1500000-999999999"] += 1
+        facets["price_ranges"][_PRICE_LABELS[bisect_right(_PRICE_EDGES, prop["price"])]] += 1
         
         # Square feet ranges
-        sqft = prop["square_feet"]
-        if sqft < 800:
-            facets["square_feet_ranges"]["0-800"] += 1
-        elif sqft < 1200:
-            facets["square_feet_ranges"]["800-1200"] += 1
-        elif sqft < 1800:
-            facets["square_feet_ranges"]["1200-1800"] += 1
-        elif sqft < 2500:
-            facets["square_feet_ranges"]["1800-2500"] += 1
-        else:
-            facets["square_feet_ranges"]["2500-999999"] += 1
+        facets["square_feet_ranges"][_SQFT_LABELS[bisect_right(_SQFT_EDGES, prop["square_feet"])]] += 1
     
     return facets
 
 
-def calculate_facets_excluding_filter(
+def filter_and_facet_properties(
     properties: List[Dict[str, Any]],
-    exclude_property_type: bool = False,
-    exclude_bedrooms: bool = False,
-    exclude_price: bool = False,
-    exclude_sqft: bool = False,
+    scores: Dict[str, int],
     title: Optional[str] = None,
     description: Optional[str] = None,
     property_type: Optional[List[str]] = None,
@@ -530,58 +492,104 @@ def calculate_facets_excluding_filter(
     max_price: Optional[int] = None,
     min_sqft: Optional[int] = None,
     max_sqft: Optional[int] = None,
-) -> Dict[str, Any]:
-    """Calculate facets from properties, excluding specified filters.
-    
-    Properties should already be scored via score_title_and_description().
-    This allows showing all facet options even when some are selected.
-    For example, if property_type filter is applied, we calculate facets
-    from properties matching all other filters but not the property_type filter.
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Filter properties and calculate all facet groups in a single pass.
+    
+    Scores should come from score_title_and_description(). When title or description is
+    given, only properties with a score are kept, unless nothing scored at all.
+    Returns the matching properties (the original dicts, not copies) and the facet counts.
+    Each facet group counts the properties that match every filter except the
+    group's own, so all options in a group stay visible while some are selected
+    and the other groups update accordingly.
     """
-    # Filter properties excluding the specified filter groups
-    filtered = copy.deepcopy(properties)
-    
     # Filter out properties with score of 0 (no relevance matches)
     # Only apply this filter if there is a text query (title or description)
-    if title or description:
-        filtered = [p for p in filtered if p.get("score", 0) > 0]
-        # If score filtering removed all items, fall back to showing all properties
-        if len(filtered) == 0:
-            filtered = copy.deepcopy(properties)
-    
-    # Apply filters, excluding the ones specified
-    if property_type and not exclude_property_type:
-        filtered = [p for p in filtered if p["property_type"] in property_type]
-    
-    if bedrooms and not exclude_bedrooms:
-        bedroom_nums = [int(b) for b in bedrooms if b.isdigit()]
-        filtered = [p for p in filtered if p["bedrooms"] in bedroom_nums]
-    
-    if min_price is not None and not exclude_price:
-        filtered = [p for p in filtered if p["price"] >= min_price]
-    if max_price is not None and not exclude_price:
-        filtered = [p for p in filtered if p["price"] <= max_price]
-    
-    if min_sqft is not None and not exclude_sqft:
-        filtered = [p for p in filtered if p["square_feet"] >= min_sqft]
-    if max_sqft is not None and not exclude_sqft:
-        filtered = [p for p in filtered if p["square_feet"] <= max_sqft]
-    
-    # Calculate facets from the filtered properties
-    return calculate_facets(filtered)
-
-
-def sort_properties(properties: List[Dict[str, Any]], sort_by: str) -> List[Dict[str, Any]]:
-    """Sort properties based on sort parameter."""
-    if sort_by == "price_asc":
-        return sorted(properties, key=lambda x: x["price"])
-    elif sort_by == "price_desc":
-        return sorted(properties, key=lambda x: x["price"], reverse=True)
-    elif sort_by == "newest":
-        return sorted(properties, key=lambda x: x["listing_date"], reverse=True)
+    # If nothing matched the text query, fall back to showing all properties
+    require_score = bool(title or description) and bool(scores)
+    
+    bedroom_nums = {int(b) for b in bedrooms if b.isdigit()} if bedrooms else None
+    type_set = set(property_type) if property_type else None
+    filtered = []
+    facets = _empty_facets()
+    type_counts = facets["property_type"]
+    bedroom_counts = facets["bedrooms"]
+    price_counts = facets["price_ranges"]
+    sqft_counts = facets["square_feet_ranges"]
+    
+    for prop in properties:
+        if require_score and prop["id"] not in scores:
+            continue
+        
+        # Evaluate each filter group once per property
+        type_ok = type_set is None or prop["property_type"] in type_set
+        bedrooms_ok = bedroom_nums is None or prop["bedrooms"] in bedroom_nums
+        price = prop["price"]
+        price_ok = (min_price is None or price >= min_price) and (max_price is None or price <= max_price)
+        sqft = prop["square_feet"]
+        sqft_ok = (min_sqft is None or sqft >= min_sqft) and (max_sqft is None or sqft <= max_sqft)
+        
+        # Count the property in each group whose other filters all match
+        if bedrooms_ok and price_ok and sqft_ok:
+            pt = prop["property_type"]
+            type_counts[pt] = type_counts.get(pt, 0) + 1
+        if type_ok and price_ok and sqft_ok:
+            br = str(prop["bedrooms"])
+            bedroom_counts[br] = bedroom_counts.get(br, 0) + 1
+        if type_ok and bedrooms_ok and sqft_ok:
+            price_counts[_PRICE_LABELS[bisect_right(_PRICE_EDGES, price)]] += 1
+        if type_ok and bedrooms_ok and price_ok:
+            sqft_counts[_SQFT_LABELS[bisect_right(_SQFT_EDGES, sqft)]] += 1
+        
+        if type_ok and bedrooms_ok and price_ok and sqft_ok:
+            filtered.append(prop)
+    
+    return filtered, facets
+
+
+# Sort key and direction for each non-relevance sort order
+_SORT_KEYS = {
+    "price_asc": (itemgetter("price"), False),
+    "price_desc": (itemgetter("price"), True),
+    "newest": (itemgetter("listing_date"), True),
+}
+
+
+def sort_properties(
+    properties: List[Dict[str, Any]],
+    sort_by: str,
+    scores: Optional[Dict[str, int]] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Sort properties based on sort parameter.
+    
+    Relevance sorting uses the scores from score_title_and_description().
+    If limit is given, only the first `limit` properties in sorted order are returned,
+    selected with a heap instead of sorting the whole list.
+    """
+    if sort_by in _SORT_KEYS:
+        key, descending = _SORT_KEYS[sort_by]
     else:  # relevance (default) - sort by score descending (highest score first)
-        properties = sorted(properties, key=lambda x: x.get("score", 0), reverse=True)
-        return properties
+        scores = scores or {}
+        key, descending = (lambda x: scores.get(x["id"], 0)), True
+    
+    # nlargest/nsmallest match sorted(...)[:limit], including the order of ties
+    if limit is not None:
+        if descending:
+            return heapq.nlargest(limit, properties, key=key)
+        return heapq.nsmallest(limit, properties, key=key)
+    return sorted(properties, key=key, reverse=descending)
+
+
+# Search responses over MOCK_PROPERTIES keyed by the normalized search parameters.
+# The data never changes, so repeated searches (the first page load, toggling a facet
+# back and forth, re-running a query) reuse the computed response. Entries expire so
+# rarely repeated searches do not hold their slot indefinitely.
+_search_results: TTLCache[Dict[str, Any]] = TTLCache(maxsize=512, ttl=600)
+
+
+def _normalize_text(text: Optional[str]) -> str:
+    """Normalize search text for cache keys: lowercase with collapsed whitespace."""
+    return " ".join(text.lower().split()) if text else ""
 
 
 async def search_properties(
@@ -602,33 +610,19 @@ async def search_properties(
     """Shared search implementation for properties.
     
     This function implements the search logic that is shared between
-    traditional and beginner_ai search endpoints.
+    traditional and intermediate_ai search endpoints.
     
     Args:
-        api_path: The API path prefix for logging (e.g., "/api/search" or "/api/beginner_ai/search")
+        api_path: The API path prefix for logging (e.g., "/api/search" or "/api/intermediate_ai/search")
         logger_instance: Logger instance to use for logging
         mock_properties: List of properties to search (defaults to importing from mock_data)
     """
-    import logging
-    from backend.mock_data import MOCK_PROPERTIES
-    
     if logger_instance is None:
-        logger_instance = logging.getLogger(__name__)
+        logger_instance = logger
     
     if mock_properties is None:
         mock_properties = MOCK_PROPERTIES
     
-    logger_instance.info("=" * 60)
-    logger_instance.info(f"GET {api_path} - Search request received")
-    logger_instance.info(f"  Query (user input): {q}")
-    logger_instance.info(f"  Title search: {title}")
-    logger_instance.info(f"  Description search: {description}")
-    logger_instance.info(f"  Property types: {property_type}")
-    logger_instance.info(f"  Bedrooms: {bedrooms}")
-    logger_instance.info(f"  Price range: ${min_price} - ${max_price}")
-    logger_instance.info(f"  Square feet: {min_sqft} - {max_sqft}")
-    logger_instance.info(f"  Sort: {sort}")
-    
     # For now, if q is provided but title/description are not, mimic q
     # This allows backward compatibility while transitioning to separate title/description
     effective_title = title if title is not None else q
@@ -638,107 +632,60 @@ async def search_properties(
     property_types = property_type.split(",") if property_type else None
     bedroom_list = bedrooms.split(",") if bedrooms else None
     
-    logger_instance.info(f"  Parsed property types: {property_types}")
-    logger_instance.info(f"  Parsed bedrooms: {bedroom_list}")
-    logger_instance.info(f"  Effective title: {effective_title}")
-    logger_instance.info(f"  Effective description: {effective_description}")
+    # Emit the request header as one record to take the logging lock once
+    if logger_instance.isEnabledFor(logging.INFO):
+        logger_instance.info("\n".join([
+            "=" * 60,
+            f"GET {api_path} - Search request received",
+            f"  Query (user input): {q}",
+            f"  Title search: {title}",
+            f"  Description search: {description}",
+            f"  Property types: {property_type}",
+            f"  Bedrooms: {bedrooms}",
+            f"  Price range: ${min_price} - ${max_price}",
+            f"  Square feet: {min_sqft} - {max_sqft}",
+            f"  Sort: {sort}",
+            f"  Parsed property types: {property_types}",
+            f"  Parsed bedrooms: {bedroom_list}",
+            f"  Effective title: {effective_title}",
+            f"  Effective description: {effective_description}",
+        ]))
+    
+    # Scoring ignores case and spacing and the filters ignore value order, so
+    # equivalent searches share a cache entry
+    cache_key = None
+    if mock_properties is MOCK_PROPERTIES:
+        cache_key = (
+            _normalize_text(effective_title),
+            _normalize_text(effective_description),
+            tuple(sorted(set(property_types))) if property_types else None,
+            tuple(sorted(set(bedroom_list))) if bedroom_list else None,
+            min_price,
+            max_price,
+            min_sqft,
+            max_sqft,
+            sort if sort in _VALID_SORTS else "relevance",
+        )
+        cached_result = _search_results.get(cache_key)
+        if cached_result is not None:
+            if logger_instance.isEnabledFor(logging.INFO):
+                logger_instance.info(f"  Returning cached results ({cached_result['total']} total)\n" + "=" * 60)
+            # Hand out a copy so callers cannot alter the cached entry
+            return copy.deepcopy(cached_result)
     
     # Score properties based on title/description (do this once)
-    logger_instance.info(f"  Starting with {len(mock_properties)} total properties")
-    scored_properties = score_title_and_description(
+    scores = score_title_and_description(
         mock_properties,
         title=effective_title,
         description=effective_description,
     )
     
-    # Filter properties (using pre-scored properties)
-    filtered = filter_properties(
-        scored_properties,
-        title=effective_title,
-        description=effective_description,
-        property_type=property_types,
-        bedrooms=bedroom_list,
-        min_price=min_price,
-        max_price=max_price,
-        min_sqft=min_sqft,
-        max_sqft=max_sqft,
-    )
-    logger_instance.info(f"  After filtering: {len(filtered)} properties")
-    
-    # Sort
-    sorted_props = sort_properties(filtered, sort)
-    logger_instance.info(f"  After sorting by '{sort}': {len(sorted_props)} properties")
-    
-    # Limit to 10 results (but keep total count)
-    total = len(sorted_props)
-    limited_results = sorted_props[:10]
-    logger_instance.info(f"  Limiting results: showing {len(limited_results)} of {total} properties")
-    
-    # Calculate facets from filtered results, excluding each facet group's own filter
-    # This allows showing all facet options even when some are selected
-    # Each facet group is calculated separately, excluding only its own filter
-    # but including all other filters, so when one facet changes, others update accordingly
-    
-    # Calculate property_type facets (exclude property_type filter if applied, include all others)
-    property_type_facets = calculate_facets_excluding_filter(
-        scored_properties,
-        exclude_property_type=bool(property_types),  # Only exclude if filter is applied
-        exclude_bedrooms=False,
-        exclude_price=False,
-        exclude_sqft=False,
-        title=effective_title,
-        description=effective_description,
-        property_type=property_types,
-        bedrooms=bedroom_list,
-        min_price=min_price,
-        max_price=max_price,
-        min_sqft=min_sqft,
-        max_sqft=max_sqft,
-    )
-    
-    # Calculate bedrooms facets (exclude bedrooms filter if applied, include all others)
-    bedrooms_facets = calculate_facets_excluding_filter(
-        scored_properties,
-        exclude_property_type=False,
-        exclude_bedrooms=bool(bedroom_list),  # Only exclude if filter is applied
-        exclude_price=False,
-        exclude_sqft=False,
-        title=effective_title,
-        description=effective_description,
-        property_type=property_types,
-        bedrooms=bedroom_list,
-        min_price=min_price,
-        max_price=max_price,
-        min_sqft=min_sqft,
-        max_sqft=max_sqft,
-    )
-    
-    # Calculate price_ranges facets (exclude price filter if applied, include all others)
-    has_price_filter = min_price is not None or max_price is not None
-    price_facets = calculate_facets_excluding_filter(
-        scored_properties,
-        exclude_property_type=False,
-        exclude_bedrooms=False,
-        exclude_price=has_price_filter,  # Only exclude if filter is applied
-        exclude_sqft=False,
-        title=effective_title,
-        description=effective_description,
-        property_type=property_types,
-        bedrooms=bedroom_list,
-        min_price=min_price,
-        max_price=max_price,
-        min_sqft=min_sqft,
-        max_sqft=max_sqft,
-    )
-    
-    # Calculate square_feet_ranges facets (exclude sqft filter if applied, include all others)
-    has_sqft_filter = min_sqft is not None or max_sqft is not None
-    sqft_facets = calculate_facets_excluding_filter(
-        scored_properties,
-        exclude_property_type=False,
-        exclude_bedrooms=False,
-        exclude_price=False,
-        exclude_sqft=has_sqft_filter,  # Only exclude if filter is applied
+    # Filter properties (using pre-scored properties) and calculate facets in the same pass
+    # Each facet group excludes only its own filter but includes all others,
+    # so when one facet changes, others update accordingly
+    filtered, facets = filter_and_facet_properties(
+        mock_properties,
+        scores,
         title=effective_title,
         description=effective_description,
         property_type=property_types,
@@ -749,20 +696,30 @@ async def search_properties(
         max_sqft=max_sqft,
     )
     
-    # Combine all facets
-    facets = {
-        "property_type": property_type_facets["property_type"],
-        "bedrooms": bedrooms_facets["bedrooms"],
-        "price_ranges": price_facets["price_ranges"],
-        "square_feet_ranges": sqft_facets["square_feet_ranges"],
-    }
-    logger_instance.info(f"  Facets calculated: {len(facets)} facet groups")
-    
-    logger_instance.info(f"  Returning {len(limited_results)} of {total} results")
-    logger_instance.info("=" * 60)
-    
-    return {
+    # Sort and limit to 10 results (but keep total count)
+    total = len(filtered)
+    # Only the returned properties are copied, with their score added
+    limited_results = [
+        {**copy.deepcopy(prop), "score": scores.get(prop["id"], 0)}
+        for prop in sort_properties(filtered, sort, scores, limit=10)
+    ]
+    
+    # Summarize the pipeline in one record as well
+    if logger_instance.isEnabledFor(logging.INFO):
+        logger_instance.info("\n".join([
+            f"  Starting with {len(mock_properties)} total properties",
+            f"  After filtering: {len(filtered)} properties",
+            f"  Sorted by '{sort}'",
+            f"  Facets calculated: {len(facets)} facet groups",
+            f"  Returning {len(limited_results)} of {total} results",
+            "=" * 60,
+        ]))
+    
+    result = {
         "results": limited_results,
         "total": total,
         "facets": facets,
     }
+    if cache_key is not None:
+        _search_results.set(cache_key, copy.deepcopy(result))
+    return result
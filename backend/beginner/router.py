@@ -1,6 +1,6 @@
 import logging
 from fastapi import APIRouter, Query, HTTPException
-from typing import Optional
+from typing import Optional, Dict, Any
 from backend.query_interpreter import interpret_user_query
 
 logger = logging.getLogger(__name__)
@@ -8,18 +8,21 @@ logger = logging.getLogger(__name__)
 # Create router for beginner_ai search API
 router = APIRouter(prefix="/api/beginner_ai", tags=["beginner_ai"])
 
-@router.get("/interpret")
+@router.get("/interpret", response_model=Optional[Dict[str, Any]])
 async def interpret_query(
     q: Optional[str] = Query(None, description="User's search query (what they typed)"),
 ):
     """Interpret user query using OpenAI agent and return structured parameters."""
-    logger.info("=" * 60)
-    logger.info("GET /api/beginner_ai/interpret - Interpret query request")
-    logger.info(f"  Query (user input): {q}")
+    # Emit the request header as one record to take the logging lock once
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join([
+            "=" * 60,
+            "GET /api/beginner_ai/interpret - Interpret query request",
+            f"  Query (user input): {q}",
+        ]))
     
     if not q:
-        logger.info("  No query provided, returning None")
-        logger.info("=" * 60)
+        logger.info("  No query provided, returning None\n" + "=" * 60)
         return None
     
     try:
@@ -27,13 +30,12 @@ async def interpret_query(
         
         if interpreted_params:
             # Convert to dict for JSON response
-            result = interpreted_params.model_dump(exclude_none=True)
-            logger.info(f"  Interpretation successful: {result}")
-            logger.info("=" * 60)
+            result = interpreted_params.to_dict_non_none()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"  Interpretation successful: {result}\n" + "=" * 60)
             return result
         else:
-            logger.info("  Interpretation returned None (OpenAI API may not be configured)")
-            logger.info("=" * 60)
+            logger.info("  Interpretation returned None (OpenAI API may not be configured)\n" + "=" * 60)
             return None
     except Exception as e:
         logger.error(f"  Error interpreting query: {e}", exc_info=True)
@@ -2,16 +2,16 @@
 Special AI logic for intermediate AI search features.
 """
 
-import os
-import json
+import asyncio
+import hashlib
 import logging
+import threading
 from typing import Optional, Dict, Any, List
-from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-from agents import Agent, Runner
-
-# Load environment variables
-load_dotenv()
+from pydantic_core import to_json
+from agents import Agent, AgentOutputSchema, Runner
+from backend.cache import TTLCache
+from backend.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,29 @@ class SearchSummaryOutput(BaseModel):
     search_ideas: List[str] = Field(description="An array of 2-3 related search idea strings")
 
 
+# The Runner otherwise rebuilds the type adapter and strict JSON schema on every run
+_SUMMARY_OUTPUT_SCHEMA = AgentOutputSchema(SearchSummaryOutput)
+
+
+# Result fields the summary agent uses; ids, image URLs and scores are left out of the prompt
+_SUMMARY_FIELDS = ("title", "description", "price", "bedrooms", "square_feet", "property_type", "neighborhood", "city")
+
+
+# Context line templates, in the order of generate_search_summary's search parameters
+_CONTEXT_TEMPLATES = (
+    'Query: "{}"',
+    'Title search: "{}"',
+    'Description search: "{}"',
+    'Property types: {}',
+    'Bedrooms: {}',
+    'Min price: ${:,}',
+    'Max price: ${:,}',
+    'Min square feet: {:,}',
+    'Max square feet: {:,}',
+    'Total results: {}',
+)
+
+
 # Agent prompt for generating search summaries and ideas
 SUMMARY_AGENT_PROMPT = """You are an AI assistant that helps users understand their real estate search results and discover new search ideas.
 
@@ -66,8 +89,7 @@ Return a JSON object with:
 
 def _create_summary_agent() -> Optional[Agent]:
     """Create and configure the summary agent."""
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
+    if not settings.openai_api_key:
         return None
     
     try:
@@ -75,7 +97,7 @@ def _create_summary_agent() -> Optional[Agent]:
         agent = Agent(
             name="Search Summary Generator",
             instructions=SUMMARY_AGENT_PROMPT,
-            output_type=SearchSummaryOutput,
+            output_type=_SUMMARY_OUTPUT_SCHEMA,
             model="gpt-4.1",
         )
         
@@ -85,6 +107,73 @@ def _create_summary_agent() -> Optional[Agent]:
         return None
 
 
+# The agent is immutable between requests, so it is built once and shared
+_summary_agent: Optional[Agent] = None
+_summary_agent_lock = threading.Lock()
+
+
+def _get_summary_agent() -> Optional[Agent]:
+    """Return the shared summary agent, creating it on first use."""
+    global _summary_agent
+    if _summary_agent is None:
+        with _summary_agent_lock:
+            if _summary_agent is None:
+                _summary_agent = _create_summary_agent()
+    return _summary_agent
+
+
+def _default_summary(total: Optional[int]) -> Dict[str, Any]:
+    """Return the summary used when the agent is unavailable or not needed."""
+    return {
+        "summary": f"Found {total or 0} properties matching your search criteria.",
+        "search_ideas": []
+    }
+
+
+# Summaries keyed by a hash of the full agent input. Identical searches (the same
+# parameters and result page) get the same summary, and concurrent identical
+# requests share one agent run instead of each making its own OpenAI call.
+_summary_cache: TTLCache[Any] = TTLCache(maxsize=512, ttl=300)
+_summary_runs: Dict[str, "asyncio.Task[Any]"] = {}
+
+
+def _finish_summary_run(key: str, task: "asyncio.Task[Any]") -> None:
+    """Forget a finished shared run and retrieve its exception.
+    
+    If every request waiting on the run was cancelled, nothing else would look at
+    the exception and asyncio would report it as never retrieved.
+    """
+    _summary_runs.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Search summary agent run failed: {task.exception()}")
+
+
+async def _run_summary_agent(agent: Agent, context_message: str) -> Any:
+    """Return the summary agent's output for a context message, sharing identical runs."""
+    key = hashlib.sha256(context_message.encode()).hexdigest()
+    summary_output = _summary_cache.get(key)
+    if summary_output is not None:
+        logger.info("Using cached search summary")
+        return summary_output
+    
+    task = _summary_runs.get(key)
+    if task is None:
+        async def run() -> Any:
+            result = await Runner.run(agent, context_message)
+            if hasattr(result.final_output, 'model_dump'):
+                _summary_cache.set(key, result.final_output)
+            return result.final_output
+        
+        task = asyncio.ensure_future(run())
+        _summary_runs[key] = task
+        task.add_done_callback(lambda done: _finish_summary_run(key, done))
+    else:
+        logger.info("Joining in-flight search summary for identical request")
+    
+    # Shield the shared run so one client disconnecting does not cancel it for the others
+    return await asyncio.shield(task)
+
+
 async def generate_search_summary(
     q: Optional[str] = None,
     title: Optional[str] = None,
@@ -117,76 +206,58 @@ async def generate_search_summary(
     Returns:
         Dict with 'summary' and 'search_ideas' keys
     """
-    if not os.getenv("OPENAI_API_KEY"):
+    # Nothing was searched for, so there is nothing for the agent to relate the results to
+    if not any((q, title, description, property_type, bedrooms)) and all(
+        value is None for value in (min_price, max_price, min_sqft, max_sqft)
+    ):
+        logger.info("No search parameters provided, returning default summary")
+        return _default_summary(total)
+    
+    if not settings.openai_api_key:
         logger.warning("OPENAI_API_KEY is not set, returning default summary")
-        return {
-            "summary": f"Found {total or 0} properties matching your search criteria.",
-            "search_ideas": []
-        }
+        return _default_summary(total)
     
     try:
-        # Create the agent
-        agent = _create_summary_agent()
+        agent = _get_summary_agent()
         if agent is None:
-            return {
-                "summary": f"Found {total or 0} properties matching your search criteria.",
-                "search_ideas": []
-            }
+            return _default_summary(total)
         
-        # Build the context message
-        context_parts = []
-        if q:
-            context_parts.append(f'Query: "{q}"')
-        if title:
-            context_parts.append(f'Title search: "{title}"')
-        if description:
-            context_parts.append(f'Description search: "{description}"')
-        if property_type:
-            context_parts.append(f'Property types: {property_type}')
-        if bedrooms:
-            context_parts.append(f'Bedrooms: {bedrooms}')
-        if min_price is not None:
-            context_parts.append(f'Min price: ${min_price:,}')
-        if max_price is not None:
-            context_parts.append(f'Max price: ${max_price:,}')
-        if min_sqft is not None:
-            context_parts.append(f'Min square feet: {min_sqft:,}')
-        if max_sqft is not None:
-            context_parts.append(f'Max square feet: {max_sqft:,}')
-        if total is not None:
-            context_parts.append(f'Total results: {total}')
+        # Build the context message from the parameters that are set
+        values = (q, title, description, property_type, bedrooms, min_price, max_price, min_sqft, max_sqft, total)
+        context_parts = [
+            template.format(value)
+            for template, value in zip(_CONTEXT_TEMPLATES, values)
+            if value is not None and value != ""
+        ]
         
         context_message = "Current search parameters:\n" + "\n".join(context_parts)
         
         # Add search results as JSON if provided
         if results:
-            results_json = json.dumps(results, indent=2)
+            # pydantic-core's Rust serializer is much faster than the stdlib json module
+            slim_results = [{k: r[k] for k in _SUMMARY_FIELDS if k in r} for r in results]
+            results_json = to_json(slim_results).decode()
             context_message += "\n\nSearch results:\n" + results_json
         
         logger.info("Calling OpenAI Agents SDK to generate search summary...")
-        logger.debug(f"Context: {context_message}")
-        
-        # Run the agent asynchronously
-        result = await Runner.run(agent, context_message)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Context: {context_message}")
         
-        # Extract the structured output
-        summary_output = result.final_output
+        # Run the agent asynchronously and extract the structured output
+        summary_output = await _run_summary_agent(agent, context_message)
         
         # Convert to dict for JSON response
-        output = summary_output.model_dump() if hasattr(summary_output, 'model_dump') else {
-            "summary": f"Found {total or 0} properties matching your search criteria.",
-            "search_ideas": []
-        }
+        output = summary_output.model_dump() if hasattr(summary_output, 'model_dump') else _default_summary(total)
         
-        logger.info("OpenAI Agents SDK summary generation completed successfully")
-        logger.info(f"Summary: {output.get('summary', 'N/A')}")
-        logger.info(f"Search ideas: {output.get('search_ideas', [])}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join([
+                "OpenAI Agents SDK summary generation completed successfully",
+                f"Summary: {output.get('summary', 'N/A')}",
+                f"Search ideas: {output.get('search_ideas', [])}",
+            ]))
         
         return output
         
     except Exception as e:
         logger.error(f"Error generating search summary with OpenAI Agents SDK: {e}", exc_info=True)
-        return {
-            "summary": f"Found {total or 0} properties matching your search criteria.",
-            "search_ideas": []
-        }
+        return _default_summary(total)
@@ -1,18 +1,25 @@
-import os
+import asyncio
+import contextlib
+import hashlib
 import logging
-import requests
-from fastapi import FastAPI, Query, HTTPException, Request
+import httpx
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Query, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Optional, Annotated
+from pydantic_core import to_json
+from typing import Optional, Annotated, Dict, Any
 from beginner.router import router as beginner_ai_router
 from intermediate.router import router as intermediate_ai_router
-from advanced.router import router as advanced_ai_router
-from backend.mock_data import MOCK_PROPERTIES
+from advanced.router import router as advanced_ai_router, prune_sessions_periodically
+from backend.config import settings
+from backend.mock_data import MOCK_PROPERTIES, MOCK_PROPERTIES_BY_ID
 from backend.utils import (
     calculate_facets,
     search_properties,
     SearchRequestParams,
+    SearchResponse,
+    Facets,
 )
 
 # Configure logging
@@ -22,23 +29,32 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request URL at INFO, which would include the ConvertKit API secret
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
-app = FastAPI()
+# Shared client for outbound HTTP calls so connections are reused across requests
+http_client = httpx.AsyncClient(timeout=10)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep the chat session database from growing without bound
+    session_pruning = asyncio.create_task(prune_sessions_periodically())
+    yield
+    session_pruning.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await session_pruning
+    await http_client.aclose()
+
+app = FastAPI(lifespan=lifespan)
 
 logger.info("=" * 60)
 logger.info("Starting Property Search Backend")
 logger.info("=" * 60)
 
-# Get allowed origins from environment or default to localhost
-allowed_origins = os.getenv(
-    "ALLOWED_ORIGINS",
-    "http://localhost:3000"
-).split(",")
-
 # Enable CORS for Next.js frontend
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origins=list(settings.allowed_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -46,7 +62,8 @@ app.add_middleware(
 
 # Shared search endpoint - handles /api/search
 # Note: /api/intermediate_ai/search is handled by its own router
-@app.get("/api/search")
+# Declaring the response model lets FastAPI serialize straight to JSON with pydantic-core
+@app.get("/api/search", response_model=SearchResponse, response_model_exclude_none=True)
 async def search(
     request: Request,
     params: Annotated[SearchRequestParams, Query()],
@@ -71,25 +88,46 @@ async def search(
     )
 
 # Shared properties endpoint - handles /api/properties/{property_id}
-@app.get("/api/properties/{property_id}")
+@app.get("/api/properties/{property_id}", response_model=Dict[str, Any])
 async def get_property(property_id: str):
     """Get a single property by ID."""
-    logger.info(f"GET /api/properties/{property_id} - Property detail request")
-    for prop in MOCK_PROPERTIES:
-        if prop["id"] == property_id:
-            logger.info(f"  Found property: {prop['title']}")
-            return prop
-    logger.warning(f"  Property not found: {property_id}")
-    raise HTTPException(status_code=404, detail="Property not found")
+    # One log record per request: the lookup itself is a single dict access
+    prop = MOCK_PROPERTIES_BY_ID.get(property_id)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("GET /api/properties/%s - %s", property_id, "hit" if prop else "miss")
+    if prop is None:
+        raise HTTPException(status_code=404, detail="Property not found")
+    return prop
+
+# Facets over all properties never change while the server runs, so compute them once
+# and let clients revalidate with an ETag
+_ALL_FACETS = calculate_facets(MOCK_PROPERTIES)
+_ALL_FACETS_ETAG = f'"{hashlib.sha256(to_json(_ALL_FACETS)).hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return whether an If-None-Match header matches etag, using weak comparison (RFC 9110)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in tags:
+        return True
+    # Weak comparison ignores the W/ prefix on either side
+    etag = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == etag for tag in tags)
 
 # Shared facets endpoint - handles /api/facets
-@app.get("/api/facets")
-async def get_facets():
+@app.get("/api/facets", response_model=Facets)
+async def get_facets(request: Request, response: Response):
     """Get available facets for all properties."""
     logger.info("GET /api/facets - Facets request")
-    facets = calculate_facets(MOCK_PROPERTIES)
+    headers = {"ETag": _ALL_FACETS_ETAG, "Cache-Control": "public, max-age=60"}
+    if _etag_matches(request.headers.get("if-none-match"), _ALL_FACETS_ETAG):
+        logger.info("  Facets not modified")
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     logger.info(f"  Returning facets for {len(MOCK_PROPERTIES)} properties")
-    return facets
+    return _ALL_FACETS
 
 # Subscription verification endpoint
 class SubscriptionRequest(BaseModel):
@@ -103,8 +141,8 @@ async def verify_subscription(request: SubscriptionRequest):
     if not email:
         return {"subscribed": False, "error": "Email is required"}
 
-    api_secret = os.getenv('CONVERTKIT_API_SECRET')
-    api_key = os.getenv('CONVERTKIT_API_KEY')
+    api_secret = settings.convertkit_api_secret
+    api_key = settings.convertkit_api_key
 
     if not api_secret or not api_key:
         logger.warning("ConvertKit API credentials not configured")
@@ -117,7 +155,7 @@ async def verify_subscription(request: SubscriptionRequest):
             'api_secret': api_secret,
             'email_address': email
         }
-        verify_response = requests.get(verify_url, params=params, timeout=10)
+        verify_response = await http_client.get(verify_url, params=params)
         verify_response.raise_for_status()
         
         # If we get subscriber data back, they are subscribed
@@ -136,7 +174,7 @@ async def verify_subscription(request: SubscriptionRequest):
                 'email': email
             }
             
-            subscribe_response = requests.post(subscribe_url, headers=headers, json=payload, timeout=10)
+            subscribe_response = await http_client.post(subscribe_url, headers=headers, json=payload)
             subscribe_response.raise_for_status()
             
             logger.info(f"Successfully subscribed email {email}")
@@ -144,13 +182,14 @@ async def verify_subscription(request: SubscriptionRequest):
                 "subscribed": False, 
                 "error": None
             }
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.warning(f"Error subscribing email {email}: {e}")
             return {
                 "subscribed": False, 
                 "error": f"Subscription error: {str(e)}"
             }
-    except requests.exceptions.RequestException as e:
+    # A non-JSON body (e.g. a proxy error page) makes .json() raise a ValueError
+    except (httpx.HTTPError, ValueError) as e:
         logger.warning(f"Error verifying subscription: {e}")
         return {
             "subscribed": False, 
@@ -0,0 +1,171 @@
+"""
+Tests for the TTLCache used by the session, chat, interpretation, summary and search caches.
+"""
+
+import pytest
+from backend import cache
+from backend.cache import TTLCache
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+def test_get_returns_value_until_ttl_expires(clock):
+    c = TTLCache(ttl=10)
+    c.set("a", 1)
+
+    clock.advance(9)
+    assert c.get("a") == 1
+
+    clock.advance(2)
+    assert c.get("a") is None
+    assert c.get("a", "missing") == "missing"
+
+
+def test_set_restarts_ttl(clock):
+    c = TTLCache(ttl=10)
+    c.set("a", 1)
+    clock.advance(8)
+    c.set("a", 1)
+    clock.advance(8)
+    assert c.get("a") == 1
+
+
+def test_without_ttl_entries_never_expire(clock):
+    c = TTLCache()
+    c.set("a", 1)
+    clock.advance(10**9)
+    assert c.get("a") == 1
+
+
+def test_maxsize_evicts_least_recently_used(clock):
+    c = TTLCache(maxsize=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    # Reading "a" makes "b" the least recently used entry
+    assert c.get("a") == 1
+    c.set("c", 3)
+
+    assert c.get("b") is None
+    assert c.get("a") == 1
+    assert c.get("c") == 3
+    assert len(c) == 2
+
+
+def test_overwrite_refreshes_lru_position(clock):
+    c = TTLCache(maxsize=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.set("a", 10)
+    c.set("c", 3)
+
+    assert c.get("a") == 10
+    assert c.get("b") is None
+
+
+def test_on_evict_called_on_expiry(clock):
+    evicted = []
+    c = TTLCache(ttl=10, on_evict=evicted.append)
+    c.set("a", "value")
+    clock.advance(11)
+
+    assert c.get("a") is None
+    assert evicted == ["value"]
+
+
+def test_on_evict_called_on_maxsize_eviction(clock):
+    evicted = []
+    c = TTLCache(maxsize=1, on_evict=evicted.append)
+    c.set("a", "first")
+    c.set("b", "second")
+
+    assert evicted == ["first"]
+
+
+def test_on_evict_called_on_overwrite_with_different_value(clock):
+    evicted = []
+    c = TTLCache(on_evict=evicted.append)
+    value = ["same"]
+    c.set("a", value)
+    # Storing the same object again only refreshes the entry
+    c.set("a", value)
+    assert evicted == []
+
+    c.set("a", ["new"])
+    assert evicted == [["same"]]
+    assert c.get("a") == ["new"]
+
+
+def test_on_evict_called_on_pop(clock):
+    evicted = []
+    c = TTLCache(on_evict=evicted.append)
+    c.set("a", "value")
+
+    assert c.pop("a") == "value"
+    assert evicted == ["value"]
+    assert c.pop("a", "missing") == "missing"
+    assert evicted == ["value"]
+
+
+def test_pop_of_expired_key_returns_default(clock):
+    evicted = []
+    c = TTLCache(ttl=10, on_evict=evicted.append)
+    c.set("a", "value")
+    clock.advance(11)
+
+    assert c.pop("a", "missing") == "missing"
+    assert evicted == ["value"]
+
+
+def test_on_evict_called_on_clear(clock):
+    evicted = []
+    c = TTLCache(on_evict=evicted.append)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.clear()
+
+    assert sorted(evicted) == [1, 2]
+    assert len(c) == 0
+
+
+def test_contains_is_false_for_expired_key(clock):
+    c = TTLCache(ttl=10)
+    c.set("a", 1)
+    assert "a" in c
+
+    clock.advance(11)
+    assert "a" not in c
+
+
+def test_len_does_not_count_expired_entries(clock):
+    evicted = []
+    c = TTLCache(ttl=10, on_evict=evicted.append)
+    c.set("a", 1)
+    clock.advance(5)
+    c.set("b", 2)
+    assert len(c) == 2
+
+    clock.advance(6)
+    assert len(c) == 1
+    assert evicted == [1]
+
+    clock.advance(5)
+    assert len(c) == 0
+    assert evicted == [1, 2]
@@ -0,0 +1,55 @@
+"""
+Tests for the advanced chat endpoint's handling of trivial messages.
+"""
+
+import dataclasses
+from types import SimpleNamespace
+import pytest
+from fastapi.testclient import TestClient
+import main
+from advanced import router as chat
+
+
+@pytest.fixture
+def runner(monkeypatch, tmp_path):
+    """Stand in for the chat agent and keep session history in a temporary database."""
+    calls = []
+
+    async def run(agent, user_message_with_context, session=None):
+        calls.append(user_message_with_context)
+        return SimpleNamespace(final_output=chat.ChatAgentOutput(message="Searching now."))
+
+    monkeypatch.setattr(chat, "settings", dataclasses.replace(chat.settings, sessions_db=str(tmp_path / "sessions.db")))
+    monkeypatch.setattr(chat, "_chat_agent", object())
+    monkeypatch.setattr(chat.Runner, "run", run)
+    chat._sessions.clear()
+    chat._chat_output_cache.clear()
+    yield calls
+    chat._sessions.clear()
+    chat._chat_output_cache.clear()
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize("message", ["hi", "Hello!", "thanks", "ok"])
+def test_trivial_opening_message_bypasses_agent(client, runner, message):
+    response = client.post("/api/advanced_ai/chat", json={"message": message})
+
+    assert response.status_code == 200
+    assert response.json()["message"] == chat._TRIVIAL_REPLIES[message.rstrip("!").lower()]
+    assert runner == []
+
+
+@pytest.mark.parametrize("message", ["ok", "okay", "thanks"])
+def test_trivial_reply_later_in_conversation_reaches_agent(client, runner, message):
+    session_id = client.post("/api/advanced_ai/chat", json={"message": "hi"}).json()["session_id"]
+
+    # e.g. confirming "Want me to search for 3-bed condos under $500k?"
+    response = client.post("/api/advanced_ai/chat", json={"message": message, "session_id": session_id})
+
+    assert response.status_code == 200
+    assert response.json()["message"] == "Searching now."
+    assert len(runner) == 1
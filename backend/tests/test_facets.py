@@ -0,0 +1,50 @@
+"""
+Tests for the /api/facets endpoint and its ETag revalidation.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+import main
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def test_facets_returned_with_etag(client):
+    response = client.get("/api/facets")
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == main._ALL_FACETS_ETAG
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert response.json() == main._ALL_FACETS
+
+
+@pytest.mark.parametrize("if_none_match", [
+    main._ALL_FACETS_ETAG,
+    f"W/{main._ALL_FACETS_ETAG}",
+    f'"other", {main._ALL_FACETS_ETAG}',
+    f'"other",W/{main._ALL_FACETS_ETAG}',
+    "*",
+])
+def test_matching_etag_returns_not_modified(client, if_none_match):
+    response = client.get("/api/facets", headers={"If-None-Match": if_none_match})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == main._ALL_FACETS_ETAG
+    assert response.content == b""
+
+
+@pytest.mark.parametrize("if_none_match", [
+    '"other"',
+    # A tag that merely contains the current one is a different tag
+    f'"x{main._ALL_FACETS_ETAG[1:-1]}x"',
+    main._ALL_FACETS_ETAG[1:-1],
+    "",
+])
+def test_non_matching_etag_returns_facets(client, if_none_match):
+    response = client.get("/api/facets", headers={"If-None-Match": if_none_match})
+
+    assert response.status_code == 200
+    assert response.json() == main._ALL_FACETS
@@ -0,0 +1,31 @@
+"""
+Tests for the app lifespan's background session pruning.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+import main
+
+
+def test_shutdown_waits_for_session_pruning_to_stop(monkeypatch):
+    events = []
+
+    async def prune_sessions_periodically():
+        try:
+            await asyncio.Event().wait()
+        finally:
+            # Stands in for a prune that is still finishing when shutdown starts
+            await asyncio.sleep(0)
+            events.append("pruning stopped")
+
+    async def aclose():
+        events.append("client closed")
+
+    monkeypatch.setattr(main, "prune_sessions_periodically", prune_sessions_periodically)
+    monkeypatch.setattr(main, "http_client", SimpleNamespace(aclose=aclose))
+
+    with TestClient(main.app):
+        pass
+
+    assert events == ["pruning stopped", "client closed"]
@@ -0,0 +1,68 @@
+"""
+Tests for the cached search_properties pipeline.
+"""
+
+import asyncio
+import copy
+import pytest
+from backend import utils
+from backend.mock_data import MOCK_PROPERTIES
+
+
+@pytest.fixture(autouse=True)
+def empty_search_cache():
+    utils._search_results.clear()
+    yield
+    utils._search_results.clear()
+
+
+def search(**kwargs):
+    return asyncio.run(utils.search_properties(**kwargs))
+
+
+def test_identical_searches_return_equal_results():
+    first = search(q="family home", bedrooms="3,4", sort="price_asc")
+    second = search(q="family home", bedrooms="3,4", sort="price_asc")
+
+    assert second == first
+    assert len(utils._search_results) == 1
+
+
+def test_equivalent_searches_share_a_cache_entry():
+    first = search(q="Family  Home", property_type="house,condo")
+    second = search(q="family home", property_type="condo,house")
+
+    assert second == first
+    assert len(utils._search_results) == 1
+
+
+def test_cached_results_match_an_uncached_search():
+    cached = search(q="bay views", min_price=500000)
+    # A caller-supplied property list bypasses the cache
+    uncached = search(q="bay views", min_price=500000, mock_properties=list(MOCK_PROPERTIES))
+
+    assert cached == uncached
+
+
+def test_mutating_a_result_does_not_change_the_cache():
+    original = search(q="spacious", sort="newest")
+    expected = copy.deepcopy(original)
+
+    # Mutate the response from the miss, then the one from the hit
+    for result in (original, search(q="spacious", sort="newest")):
+        result["results"][0]["title"] = "changed"
+        result["results"][0]["images"].append("/images/extra.png")
+        result["results"].pop()
+        result["facets"]["bedrooms"].clear()
+        result["total"] = -1
+
+    assert search(q="spacious", sort="newest") == expected
+
+
+def test_mutating_a_result_does_not_change_the_mock_data():
+    before = copy.deepcopy(MOCK_PROPERTIES)
+    result = search(q="home")
+    result["results"][0]["images"].append("/images/extra.png")
+    result["results"][0]["price"] = 0
+
+    assert MOCK_PROPERTIES == before
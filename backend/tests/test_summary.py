@@ -0,0 +1,116 @@
+"""
+Tests for sharing summary agent runs between identical requests.
+"""
+
+import asyncio
+import gc
+import logging
+from types import SimpleNamespace
+import pytest
+from intermediate import logic
+from intermediate.logic import SearchSummaryOutput
+
+
+@pytest.fixture(autouse=True)
+def empty_summary_cache():
+    logic._summary_cache.clear()
+    logic._summary_runs.clear()
+    yield
+    logic._summary_cache.clear()
+    logic._summary_runs.clear()
+
+
+class FakeRunner:
+    """Stand-in for Runner.run that records calls and can be released or failed on demand."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.error = error
+        self.release = None
+
+    async def run(self, agent, context_message):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(final_output=SearchSummaryOutput(summary=context_message, search_ideas=[]))
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    fake = FakeRunner()
+    monkeypatch.setattr(logic.Runner, "run", fake.run)
+    return fake
+
+
+def test_concurrent_identical_calls_share_one_agent_run(runner):
+    async def scenario():
+        runner.release = asyncio.Event()
+        calls = [asyncio.ensure_future(logic._run_summary_agent(None, "same context")) for _ in range(5)]
+        await asyncio.sleep(0)
+        runner.release.set()
+        return await asyncio.gather(*calls)
+
+    outputs = asyncio.run(scenario())
+
+    assert runner.calls == 1
+    assert all(output is outputs[0] for output in outputs)
+    assert outputs[0].summary == "same context"
+    assert logic._summary_runs == {}
+
+
+def test_different_calls_run_separately(runner):
+    async def scenario():
+        runner.release = asyncio.Event()
+        runner.release.set()
+        return await asyncio.gather(
+            logic._run_summary_agent(None, "first"),
+            logic._run_summary_agent(None, "second"),
+        )
+
+    first, second = asyncio.run(scenario())
+
+    assert runner.calls == 2
+    assert (first.summary, second.summary) == ("first", "second")
+
+
+def test_finished_run_is_served_from_cache(runner):
+    async def scenario():
+        runner.release = asyncio.Event()
+        runner.release.set()
+        first = await logic._run_summary_agent(None, "context")
+        second = await logic._run_summary_agent(None, "context")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert runner.calls == 1
+    assert second is first
+
+
+def test_failed_run_with_every_waiter_cancelled_is_logged(runner, caplog):
+    runner.error = RuntimeError("agent failed")
+    unhandled = []
+
+    async def scenario():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        runner.release = asyncio.Event()
+        waiter = asyncio.ensure_future(logic._run_summary_agent(None, "context"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        # The shared run keeps going after its only waiter is cancelled, then fails
+        runner.release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        gc.collect()
+
+    asyncio.run(scenario())
+    gc.collect()
+
+    assert runner.calls == 1
+    assert logic._summary_runs == {}
+    assert unhandled == []
+    assert any(
+        record.levelno == logging.WARNING and "agent failed" in record.getMessage()
+        for record in caplog.records
+    )
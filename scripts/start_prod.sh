@@ -37,7 +37,9 @@ echo "Starting backend server..."
 cd /app/backend
 
 # Use the virtual environment's Python directly
-/app/backend/.venv/bin/python -m uvicorn main:app --host 0.0.0.0 --port 8000 > /tmp/backend.log 2>&1 &
+# uvloop and httptools come with uvicorn[standard]; name them so a missing one fails at startup
+# Single worker: the TTL caches are per process (chat history is in the on-disk sessions DB)
+/app/backend/.venv/bin/python -m uvicorn main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools > /tmp/backend.log 2>&1 &
 BACKEND_PID=$!
 
 # Wait for backend to start and verify it's listening